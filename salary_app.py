@@ -60,9 +60,40 @@ if 'altair' not in sys.modules:
 
 import streamlit as st
 import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import codecs
 import csv
 import io
 
+# Numba is optional. When it is installed, very large exports are summarized
+# with a JIT-compiled kernel instead of a pandas groupby.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Polars is optional as well. When it is installed, the app offers it as an
+# alternative backend that runs the whole pipeline as one lazy query.
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+# Cell values read as missing, matching the default NA tokens of
+# ``pd.read_csv`` so every reader treats the same markers as empty.
+NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a",
+    "nan", "null",
+]
+
+# Below this many rows the pandas groupby is already fast and JIT compilation
+# would cost more than it saves.
+NUMBA_MIN_ROWS = 1_000_000
+
 # Title of the app
 st.title("Labor Distribution Summary App")
 st.write(
@@ -76,72 +107,123 @@ st.write(
 uploaded_file = st.file_uploader(
     "Choose a CSV file", type=["csv"], accept_multiple_files=False
 )
+# Offer the Polars backend only when the optional package is installed
+use_polars = pl is not None and st.checkbox(
+    "Use the Polars backend (faster for very large files)"
+)
 
 
-def process_dataframe(df: pd.DataFrame):
-    """Process the raw DataFrame and return the cleaned data and summary tables.
+def _sum_by_name_and_type(name_codes, type_codes, amounts, n_names):
+    """Sum amounts per (name code, payment type code) for Salary and Benefit.
 
-    The function is resilient to missing columns: if any of the expected
-    columns used to detect total rows (e.g., "Fiscal Year & Fiscal Period (Combined)")
-    are absent, they are simply ignored when filtering out totals. It also
-    reorders columns only if they exist in the provided DataFrame.
+    Returns the totals and a matching boolean array marking which
+    combinations had at least one row. Missing names (code -1), "Other" rows
+    (type code 2) and NaN amounts are skipped, as they are by pandas' groupby.
     """
-    # Identify and remove rows that represent totals or grand totals. Some files
-    # may not include all of these columns, so we build a mask only from
-    # existing columns. We also handle datasets where summary rows may appear
-    # across arbitrary columns by scanning the entire DataFrame for the word
-    # "Total". If "Total" appears anywhere in a row, that row is dropped.
-    total_mask = pd.Series(False, index=df.index)
-    # First, check specific columns when present to catch typical totals rows
-    total_check_cols = [
-        "Fiscal Year & Fiscal Period (Combined)",
-        "Funds Center Name",
-        "Funds Center",
-        "Employment Status & Description (Combined)",
-    ]
-    for col in total_check_cols:
-        if col in df.columns:
-            total_mask |= df[col].astype(str).str.contains("Total", case=False, na=False)
-    # Additionally, drop any row where any cell contains "Total" (case-insensitive).
-    # This handles files with different formats where totals appear in varied columns.
+    totals = np.zeros((n_names, 2))
+    seen = np.zeros((n_names, 2), dtype=np.bool_)
+    for i in range(name_codes.size):
+        name = name_codes[i]
+        kind = type_codes[i]
+        if name < 0 or kind > 1:
+            continue
+        seen[name, kind] = True
+        if not np.isnan(amounts[i]):
+            totals[name, kind] += amounts[i]
+    return totals, seen
+
+
+if njit is not None:
+    # Streamlit re-executes this script on every rerun, so cache the compiled
+    # kernel on disk rather than recompiling it each time.
+    _sum_by_name_and_type = njit(cache=True)(_sum_by_name_and_type)
+
+
+def recode_to_utf8(raw_bytes: bytes) -> bytes:
+    """Recode a UTF-16LE upload to UTF-8, dropping any byte order mark.
+
+    Both CSV readers only have their fast native paths for UTF-8, and UTF-8
+    halves the bytes they have to scan for mostly-ASCII exports. The tradeoff
+    is memory: the decoded text and the UTF-8 copy briefly coexist with the
+    upload itself, roughly doubling peak usage for the file in exchange for
+    the faster parse. The BOM is skipped through a memoryview so the upload
+    is not copied just to drop two bytes.
+    """
+    data = memoryview(raw_bytes)
+    if raw_bytes.startswith(codecs.BOM_UTF16_LE):
+        data = data[len(codecs.BOM_UTF16_LE):]
+    return codecs.decode(data, "utf-16-le").encode("utf-8")
+
+
+def header_names(data: bytes) -> list:
+    """Return the column names from the header line of a UTF-8 export.
+
+    Quotes are honoured and blank and duplicate names are renamed the way
+    pandas does ("Unnamed: 3", "Amount.1"), so every reader produces the same
+    columns for the same upload.
+    """
+    header_end = data.find(b"\n")
+    header_line = data if header_end < 0 else data[:header_end]
+    header_text = header_line.decode("utf-8").rstrip("\r")
+    header = next(csv.reader([header_text], delimiter="\t"), [])
+    names = []
+    used = set()
+    for i, name in enumerate(header):
+        name = name or f"Unnamed: {i}"
+        unique, n = name, 0
+        while unique in used:
+            n += 1
+            unique = f"{name}.{n}"
+        used.add(unique)
+        names.append(unique)
+    return names
+
+
+def load_csv(raw_bytes: bytes) -> pd.DataFrame:
+    """Parse the uploaded UTF-16LE, tab-delimited export into a DataFrame.
+
+    pandas falls back to its slow Python-level decoding path for UTF-16 input,
+    so the bytes are recoded to UTF-8 once in memory (see ``recode_to_utf8``)
+    and parsed with PyArrow's multithreaded CSV reader instead. Every column
+    is read as a string (the equivalent of ``dtype=str``) and empty cells
+    become missing values, as they would with ``pd.read_csv``.
+
+    Files PyArrow cannot parse, such as exports with short rows, fall back to
+    ``pd.read_csv`` on the recoded bytes.
+    """
+    data = recode_to_utf8(raw_bytes)
+    string_dtype = pd.StringDtype("pyarrow")
+    # Column types must be given by name, so parse the header ourselves
+    names = header_names(data)
     try:
-        # Convert the DataFrame to string for robust checking
-        global_total_mask = df.astype(str).apply(
-            lambda col: col.str.contains("Total", case=False, na=False)
+        table = pacsv.read_csv(
+            io.BytesIO(data),
+            read_options=pacsv.ReadOptions(column_names=names, skip_rows=1),
+            parse_options=pacsv.ParseOptions(delimiter="\t"),
+            convert_options=pacsv.ConvertOptions(
+                column_types={name: pa.string() for name in names},
+                null_values=NA_VALUES,
+                strings_can_be_null=True,
+            ),
+        )
+    except pa.ArrowInvalid:
+        # Ragged or otherwise irregular exports that PyArrow rejects (e.g.
+        # short rows) still load through pandas, which pads missing cells
+        return pd.read_csv(io.BytesIO(data), sep="\t", dtype=str).astype(
+            string_dtype
         )
-        total_mask |= global_total_mask.any(axis=1)
-    except Exception:
-        # Fallback: if conversion fails (e.g., due to mixed types), skip global check
-        pass
-    # Filter out total rows
-    df = df[~total_mask].copy()
+    # Map Arrow strings to pandas' Arrow-backed ``string[pyarrow]`` dtype so
+    # ``.str`` operations dispatch to Arrow compute kernels instead of looping
+    # over Python ``str`` objects.
+    return table.to_pandas(types_mapper={pa.string(): string_dtype}.get)
 
-    # Create Full Name column and drop original name columns if they exist
-    first_name_col = "First Name"
-    last_name_col = "Last Name"
-    if first_name_col in df.columns and last_name_col in df.columns:
-        df["Full Name"] = df[first_name_col].fillna("") + " " + df[last_name_col].fillna("")
-        df.drop(columns=[first_name_col, last_name_col], inplace=True)
-    elif "Full Name" not in df.columns:
-        # If we cannot derive a full name, ensure the column exists (empty)
-        df["Full Name"] = ""
-
-    # Determine Payment Type based on GL account (prefixes 51=Salary, 52=Benefit)
-    def payment_type(gl_account: str) -> str:
-        account = str(gl_account).lstrip("0") if gl_account is not None else ""
-        if account.startswith("51"):
-            return "Salary"
-        elif account.startswith("52"):
-            return "Benefit"
-        else:
-            return "Other"
 
-    if "Gl Account" in df.columns:
-        df["Payment Type"] = df["Gl Account"].apply(payment_type)
-    else:
-        # If GL Account column is missing, classify all as Other
-        df["Payment Type"] = "Other"
+def order_columns(columns) -> list:
+    """Return ``columns`` in the app's preferred display order.
 
+    Known columns come first in a fixed order; any others are appended in
+    their original order so unfamiliar datasets keep all of their data.
+    """
     # Define desired column order. Some columns may not exist in the uploaded file,
     # so we include only those that are present.
     desired_columns = [
@@ -165,106 +247,370 @@ def process_dataframe(df: pd.DataFrame):
         "Payment Type",
         "Amount",
     ]
-    # Only keep columns that exist in df and preserve their order
-    columns_in_df = [col for col in desired_columns if col in df.columns]
+    # Only keep columns that exist in df and preserve their order. Membership is
+    # checked against sets built once rather than scanning the column lists.
+    column_set = set(columns)
+    columns_in_df = [col for col in desired_columns if col in column_set]
+    ordered_cols = set(columns_in_df)
     # Ensure "Full Name" and "Payment Type" are included even if they were added later
     for col in ["Full Name", "Payment Type"]:
-        if col not in columns_in_df and col in df.columns:
+        if col not in ordered_cols and col in column_set:
             columns_in_df.append(col)
+            ordered_cols.add(col)
     # Reorder DataFrame by including desired columns first and appending any remaining columns
     # that weren't specified. This preserves extra columns in unfamiliar datasets rather than dropping them.
-    remaining_cols = [col for col in df.columns if col not in columns_in_df]
-    df = df[columns_in_df + remaining_cols]
+    remaining_cols = [col for col in columns if col not in ordered_cols]
+    return columns_in_df + remaining_cols
+
+
+def process_dataframe(df: pd.DataFrame):
+    """Process the raw DataFrame and return the cleaned data and summary tables.
+
+    The function is resilient to missing columns: if any of the expected
+    columns used to detect total rows (e.g., "Fiscal Year & Fiscal Period (Combined)")
+    are absent, they are simply ignored when filtering out totals. It also
+    reorders columns only if they exist in the provided DataFrame.
+    """
+    # Identify and remove rows that represent totals or grand totals. Some files
+    # may not include all of these columns, so we build a mask only from
+    # existing columns. We also handle datasets where summary rows may appear
+    # across arbitrary columns by scanning the remaining text columns for the
+    # word "Total". If "Total" appears anywhere in a row, that row is dropped.
+    # The mask is a single preallocated NumPy buffer that every column check is
+    # OR-ed into in place, rather than a new Series per column.
+    total_mask = np.zeros(len(df), dtype=bool)
+    # First, check specific columns when present to catch typical totals rows
+    total_check_cols = [
+        "Fiscal Year & Fiscal Period (Combined)",
+        "Funds Center Name",
+        "Funds Center",
+        "Employment Status & Description (Combined)",
+    ]
+    for col in total_check_cols:
+        if col in df.columns:
+            is_total = df[col].astype(str).str.contains(
+                "Total", case=False, na=False, regex=False
+            )
+            np.logical_or(total_mask, is_total.to_numpy(dtype=bool), out=total_mask)
+    # Additionally, drop any row where any other text cell contains "Total"
+    # (case-insensitive). This handles files with different formats where totals
+    # appear in varied columns. Columns are checked one at a time with a literal
+    # match so we never materialize a string copy of the whole DataFrame;
+    # numeric columns cannot contain the word and are skipped. Object columns
+    # may hold non-string values, so those are cast to str first.
+    text_cols = df.select_dtypes(include=["object", "string"]).columns
+    for col in text_cols:
+        if col not in total_check_cols:
+            values = df[col]
+            if values.dtype == object:
+                values = values.astype(str)
+            is_total = values.str.contains("Total", case=False, na=False, regex=False)
+            np.logical_or(total_mask, is_total.to_numpy(dtype=bool), out=total_mask)
+    # Filter out total rows. Boolean indexing materializes the kept rows of
+    # every column; what is avoided is a second, explicit ``.copy()``. The
+    # derived columns below are collected into ``derived`` and added with a
+    # single ``assign`` call rather than mutating the filtered frame.
+    df = df.loc[~total_mask]
+    derived = {}
+    drop_cols = []
+
+    # Create Full Name column and drop original name columns if they exist
+    first_name_col = "First Name"
+    last_name_col = "Last Name"
+    if first_name_col in df.columns and last_name_col in df.columns:
+        first_names = df[first_name_col]
+        last_names = df[last_name_col]
+        if all(
+            isinstance(names.dtype, pd.StringDtype) and names.dtype.storage == "pyarrow"
+            for names in (first_names, last_names)
+        ):
+            # Join in a single Arrow kernel, treating missing names as empty,
+            # instead of two fillna calls and two concatenations
+            first_arr = pa.array(first_names)
+            joined = pc.binary_join_element_wise(
+                first_arr,
+                pa.array(last_names),
+                pa.scalar(" ", type=first_arr.type),
+                null_handling="replace",
+                null_replacement="",
+            )
+            full_name = pd.Series(
+                pd.array(joined, dtype=first_names.dtype), index=df.index
+            )
+        else:
+            full_name = pd.Series(
+                np.char.add(
+                    np.char.add(first_names.fillna("").to_numpy().astype(str), " "),
+                    last_names.fillna("").to_numpy().astype(str),
+                ),
+                index=df.index,
+            )
+        drop_cols = [first_name_col, last_name_col]
+    elif "Full Name" in df.columns:
+        full_name = df["Full Name"]
+    else:
+        # If we cannot derive a full name, ensure the column exists (empty)
+        full_name = pd.Series("", index=df.index)
+    # Names repeat on every row for an employee, so store them as a categorical;
+    # grouping then works on integer codes instead of hashing each string.
+    derived["Full Name"] = full_name.astype("category")
+
+    # Determine Payment Type based on GL account (prefixes 51=Salary, 52=Benefit).
+    # GL accounts repeat heavily, so the column is encoded as a categorical and
+    # only the unique accounts are classified; the resulting type codes are then
+    # expanded back to every row through the category codes. Payment Type is
+    # itself categorical with a fixed set of categories.
+    payment_types = ["Salary", "Benefit", "Other"]
+    if "Gl Account" in df.columns:
+        gl_accounts = df["Gl Account"].fillna("").astype("category")
+        # A prefix check is an equality test on the first two characters after
+        # the leading zeros, computed in one Arrow pass over the accounts
+        accounts = pa.array(gl_accounts.cat.categories, type=pa.string())
+        prefix = pc.utf8_slice_codeunits(
+            pc.utf8_ltrim(accounts, characters="0"), 0, 2
+        ).to_numpy(zero_copy_only=False)
+        type_codes = np.select([prefix == "51", prefix == "52"], [0, 1], default=2)
+        codes = type_codes[gl_accounts.cat.codes.to_numpy()]
+    else:
+        # If GL Account column is missing, classify all as Other
+        codes = np.full(len(df), 2)
+    derived["Payment Type"] = pd.Categorical.from_codes(
+        codes, categories=payment_types
+    )
 
     # Convert Amount for numeric summary. If Amount is not present or not string,
     # skip conversion and set numeric amount to zero.
     if "Amount" in df.columns:
-        # Remove currency symbols/commas and cast to float; invalid values become NaN
-        df["Amount_numeric"] = (
-            df["Amount"].astype(str)
-            .str.replace("$", "", regex=False)
-            .str.replace(",", "", regex=False)
-            .astype(float)
+        # Amount strings repeat heavily (e.g. "$0.00"), so dictionary-encode
+        # the column, remove currency symbols/commas and cast to float on the
+        # unique values only, then expand back to every row. Missing amounts
+        # become NaN.
+        amounts = pa.array(df["Amount"].astype("string[pyarrow]"))
+        if isinstance(amounts, pa.ChunkedArray):
+            amounts = amounts.combine_chunks()
+        encoded = pc.dictionary_encode(amounts)
+        # Trim surrounding whitespace too (common in accounting-format
+        # exports), which the Arrow cast would otherwise reject
+        cleaned = pc.replace_substring_regex(encoded.dictionary, "[$,]", "")
+        values = pc.cast(pc.utf8_trim_whitespace(cleaned), pa.float64())
+        derived["Amount_numeric"] = pc.take(values, encoded.indices).to_numpy(
+            zero_copy_only=False
         )
     else:
-        df["Amount_numeric"] = 0.0
+        derived["Amount_numeric"] = 0.0
 
-    # Summarize salary and benefits
-    salary_summary = (
-        df[df["Payment Type"] == "Salary"]
-        .groupby("Full Name")["Amount_numeric"]
+    df = df.assign(**derived).drop(columns=drop_cols)
+
+    df = df[order_columns(df.columns)]
+
+    # Nothing to summarize when every row was filtered out or no row is a
+    # Salary or Benefit payment, so skip the aggregation entirely.
+    if not (df["Payment Type"].cat.codes.to_numpy() < 2).any():
+        salary_summary = pd.DataFrame(
+            {"Full Name": pd.Series(dtype=str), "Total Salary": pd.Series(dtype=float)}
+        )
+        benefit_summary = salary_summary.rename(
+            columns={"Total Salary": "Total Benefits"}
+        )
+        return df, salary_summary, benefit_summary
+
+    # Summarize salary and benefits. Very large exports use the Numba kernel
+    # over the categorical codes when it is available.
+    if njit is not None and len(df) >= NUMBA_MIN_ROWS:
+        names = df["Full Name"].cat.categories
+        totals, seen = _sum_by_name_and_type(
+            df["Full Name"].cat.codes.to_numpy(),
+            df["Payment Type"].cat.codes.to_numpy(),
+            df["Amount_numeric"].to_numpy(dtype=np.float64),
+            len(names),
+        )
+        salary_summary = pd.DataFrame(
+            {"Full Name": names[seen[:, 0]], "Total Salary": totals[seen[:, 0], 0]}
+        )
+        benefit_summary = pd.DataFrame(
+            {"Full Name": names[seen[:, 1]], "Total Benefits": totals[seen[:, 1], 1]}
+        )
+        return df, salary_summary, benefit_summary
+
+    # Otherwise, use a single groupby pass keyed on both
+    # Full Name and Payment Type, then split the two payment types apart.
+    # Combinations with no rows come back as NaN from the unstack and are
+    # dropped, so each summary lists only people with rows of that type.
+    totals = (
+        df[df["Payment Type"].isin(["Salary", "Benefit"])]
+        .groupby(["Full Name", "Payment Type"], observed=True)["Amount_numeric"]
         .sum()
-        .reset_index()
-        .rename(columns={"Amount_numeric": "Total Salary"})
+        .unstack("Payment Type")
+        .reindex(columns=["Salary", "Benefit"])
+    )
+    salary_summary = (
+        totals["Salary"].dropna().rename("Total Salary").reset_index()
     )
     benefit_summary = (
-        df[df["Payment Type"] == "Benefit"]
-        .groupby("Full Name")["Amount_numeric"]
-        .sum()
-        .reset_index()
-        .rename(columns={"Amount_numeric": "Total Benefits"})
+        totals["Benefit"].dropna().rename("Total Benefits").reset_index()
     )
 
-    # Format aggregated amounts as US currency strings (e.g., "$1,234.56")
-    salary_summary["Total Salary"] = salary_summary["Total Salary"].apply(
-        lambda x: f"${x:,.2f}"
-    )
-    benefit_summary["Total Benefits"] = benefit_summary["Total Benefits"].apply(
-        lambda x: f"${x:,.2f}"
+    return df, salary_summary, benefit_summary
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def process_upload(raw_bytes: bytes):
+    """Parse and process an upload with pandas, caching on the raw bytes.
+
+    Streamlit reruns the whole script on every widget interaction, so the
+    result is cached. The key is the upload itself rather than the parsed
+    DataFrame: Streamlit hashes only a sample of rows for large frames, which
+    would serve stale totals after re-uploading a file with one cell changed.
+    Only the last few uploads are kept so cached frames do not accumulate in
+    server memory.
+    """
+    return process_dataframe(load_csv(raw_bytes))
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def process_csv_polars(raw_bytes: bytes):
+    """Parse and process an upload with Polars, mirroring ``process_dataframe``.
+
+    Filtering, column construction and the salary/benefit aggregation run as
+    a single multithreaded lazy query; only the results are converted to
+    pandas for display and download. Requires the optional ``polars``
+    package.
+    """
+    data = recode_to_utf8(raw_bytes)
+    # infer_schema_length=0 reads every column as a string, like ``dtype=str``;
+    # the header names are renamed the same way as in ``load_csv``
+    lf = pl.read_csv(
+        data,
+        separator="\t",
+        infer_schema_length=0,
+        null_values=NA_VALUES,
+        new_columns=header_names(data),
+    ).lazy()
+    columns = lf.collect_schema().names()
+
+    # Every column is a string, so drop any row where any cell contains
+    # "Total". The match is case-insensitive in the pattern itself rather than
+    # lowercasing a copy of every column first.
+    is_total = pl.all().str.contains("(?i)total")
+    lf = lf.filter(~pl.any_horizontal(is_total.fill_null(False)))
+
+    derived = []
+    drop_cols = []
+    if "First Name" in columns and "Last Name" in columns:
+        derived.append(
+            (
+                pl.col("First Name").fill_null("")
+                + " "
+                + pl.col("Last Name").fill_null("")
+            ).alias("Full Name")
+        )
+        drop_cols = ["First Name", "Last Name"]
+    elif "Full Name" not in columns:
+        derived.append(pl.lit("").alias("Full Name"))
+    if "Gl Account" in columns:
+        prefix = (
+            pl.col("Gl Account").fill_null("").str.strip_chars_start("0").str.slice(0, 2)
+        )
+        derived.append(
+            pl.when(prefix == "51")
+            .then(pl.lit("Salary"))
+            .when(prefix == "52")
+            .then(pl.lit("Benefit"))
+            .otherwise(pl.lit("Other"))
+            .alias("Payment Type")
+        )
+    else:
+        derived.append(pl.lit("Other").alias("Payment Type"))
+    if "Amount" in columns:
+        derived.append(
+            pl.col("Amount")
+            .str.replace_all(r"[$,]", "")
+            .str.strip_chars()
+            .cast(pl.Float64)
+            .alias("Amount_numeric")
+        )
+    else:
+        derived.append(pl.lit(0.0).alias("Amount_numeric"))
+    lf = lf.with_columns(derived).drop(drop_cols)
+    lf = lf.select(order_columns(lf.collect_schema().names()))
+
+    # Rows without a name are left out of the summaries, as pandas' groupby
+    # drops missing keys
+    totals = (
+        lf.filter(
+            pl.col("Payment Type").is_in(["Salary", "Benefit"])
+            & pl.col("Full Name").is_not_null()
+        )
+        .group_by(["Full Name", "Payment Type"])
+        .agg(pl.col("Amount_numeric").sum())
     )
+    processed, totals = pl.collect_all([lf, totals], engine="streaming")
+
+    def summary(payment_type: str, label: str) -> pd.DataFrame:
+        return (
+            totals.filter(pl.col("Payment Type") == payment_type)
+            .select(["Full Name", pl.col("Amount_numeric").alias(label)])
+            .sort("Full Name")
+            .to_pandas()
+        )
 
-    return df, salary_summary, benefit_summary
+    return (
+        processed.to_pandas(),
+        summary("Salary", "Total Salary"),
+        summary("Benefit", "Total Benefits"),
+    )
 
 
 # If a file is uploaded, process it
 if uploaded_file is not None:
-    # Read the uploaded file as a DataFrame
-    raw_df = pd.read_csv(uploaded_file, encoding="utf-16le", sep="\t", dtype=str)
-    processed_df, salary_table, benefit_table = process_dataframe(raw_df)
-
-    # Cast dataframes to plain Python types to avoid Arrow LargeUtf8/Duration issues.
-    # When pandas or pyarrow produce "LargeUtf8" types (long strings), the
-    # Streamlit front-end may throw an "Unrecognized type: 'LargeUtf8'" error
-    # because ArrowJS does not yet support these extended types. To avoid
-    # serializing columns as LargeUtf8 or Duration types, convert all columns
-    # to Python objects/strings before sending to st.dataframe. This sacrifices
-    # type fidelity (numbers become strings in the UI) but ensures the table
-    # renders without serialization errors.
-    # Convert all dataframes to string type. This forces pandas to use the
-    # object dtype for every column, which prevents pandas/pyarrow from
-    # emitting unsupported Arrow types like ``LargeUtf8`` during
-    # serialization to the browser. Without this conversion, long strings
-    # may be serialized as ``LargeUtf8``, which ArrowJS (used in the
-    # Streamlit frontend) does not recognize, leading to an
-    # ``Unrecognized type: \"LargeUtf8\"`` error on the client.
-    processed_df = processed_df.astype(str)
-    salary_table = salary_table.astype(str)
-    benefit_table = benefit_table.astype(str)
+    # Read and process the uploaded file. Both backends cache on the upload
+    # bytes, so reruns with the same upload skip straight to rendering.
+    if use_polars:
+        processed_df, salary_table, benefit_table = process_csv_polars(
+            uploaded_file.getvalue()
+        )
+    else:
+        processed_df, salary_table, benefit_table = process_upload(
+            uploaded_file.getvalue()
+        )
+
+    # Cast the displayed text to plain strings before sending it to
+    # st.dataframe. Some Streamlit front-ends cannot decode Arrow "LargeUtf8"
+    # columns ("Unrecognized type: 'LargeUtf8'"). Only the ten preview rows
+    # and the summaries' Full Name column are cast. The summary totals stay
+    # numeric so they sort correctly and get currency formatting from the
+    # column config below. The downloads work from the typed processed data.
+    export_df = processed_df.drop(columns=["Amount_numeric"])
+    processed_preview = processed_df.head(10).astype(str)
+    salary_table = salary_table.astype({"Full Name": str})
+    benefit_table = benefit_table.astype({"Full Name": str})
 
     # Display the processed data tables and summaries
     st.subheader("Processed Data (first 10 rows)")
-    st.dataframe(processed_df.head(10))
+    st.dataframe(processed_preview)
 
     st.subheader("Total Salary by Individual")
-    st.dataframe(salary_table)
+    st.dataframe(
+        salary_table,
+        column_config={
+            "Total Salary": st.column_config.NumberColumn(format="$%,.2f")
+        },
+    )
 
     st.subheader("Total Benefits by Individual")
-    st.dataframe(benefit_table)
+    st.dataframe(
+        benefit_table,
+        column_config={
+            "Total Benefits": st.column_config.NumberColumn(format="$%,.2f")
+        },
+    )
 
     # Provide a downloadable summary CSV file
-    # Create a CSV in memory
+    # Write both tables into one in-memory CSV, separated by a blank row
     output = io.StringIO()
-    writer = csv.writer(output)
-    # Write salary table header and rows
-    writer.writerow(["Full Name", "Total Salary"])
-    for _, row in salary_table.iterrows():
-        writer.writerow([row["Full Name"], row["Total Salary"]])
-    # Add a blank row to separate tables
-    writer.writerow([])
-    # Write benefits table header and rows
-    writer.writerow(["Full Name", "Total Benefits"])
-    for _, row in benefit_table.iterrows():
-        writer.writerow([row["Full Name"], row["Total Benefits"]])
+    salary_table.to_csv(output, index=False, float_format="%.2f")
+    output.write("\n")
+    benefit_table.to_csv(output, index=False, float_format="%.2f")
     # Get CSV value and encode to bytes for download
     csv_data = output.getvalue().encode("utf-8")
     st.download_button(
@@ -274,14 +620,30 @@ if uploaded_file is not None:
         mime="text/csv",
     )
 
-    # Optionally: Provide processed dataset for download as well
-    processed_output = io.StringIO()
-    processed_df.drop(columns=["Amount_numeric"], inplace=False).to_csv(
-        processed_output, index=False
+    # Optionally: Provide processed dataset for download as well. Parquet is
+    # columnar and dictionary-encodes the heavily repeated text columns, so it
+    # is much smaller and cheaper to produce than CSV for repeat analysis; CSV
+    # stays available for spreadsheet users. Both files are only serialized
+    # when their button is clicked, not on every rerun of the script.
+    def processed_parquet() -> bytes:
+        parquet_output = io.BytesIO()
+        export_df.to_parquet(parquet_output, engine="pyarrow", compression="snappy")
+        return parquet_output.getvalue()
+
+    def processed_csv() -> bytes:
+        processed_output = io.StringIO()
+        export_df.astype(str).to_csv(processed_output, index=False)
+        return processed_output.getvalue().encode("utf-8")
+
+    st.download_button(
+        label="Download Processed Data (Parquet)",
+        data=processed_parquet,
+        file_name="processed_data.parquet",
+        mime="application/octet-stream",
     )
     st.download_button(
         label="Download Processed Data",
-        data=processed_output.getvalue().encode("utf-8"),
+        data=processed_csv,
         file_name="processed_data.csv",
         mime="text/csv",
-    )
\ No newline at end of file
+    )